@@ -3,15 +3,23 @@
 
 import os
 from dataclasses import dataclass
+from functools import cache, cached_property
 from pathlib import Path
+from types import MappingProxyType
 from typing import List
 
 from dotenv import load_dotenv
 
-load_dotenv(Path(__file__).parent.parent.parent / ".env")
+@cache
+def _load_env():
+    """Parse the project .env at most once per module"""
+    load_dotenv(Path(__file__).parent.parent.parent / ".env")
 
 
-@dataclass
+_load_env()
+
+
+@dataclass(slots=True)
 class GridTradingConfig:
     """Core grid trading configuration"""
 
@@ -21,7 +29,7 @@ class GridTradingConfig:
     max_open_orders: int = 20
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskManagementConfig:
     """Essential risk management settings"""
 
@@ -35,63 +43,84 @@ class RiskManagementConfig:
 class TradingBotConfig:
     """Simplified trading bot configuration"""
 
-    # API Configuration
-    binance_api_key: str = os.getenv("BINANCE_API_KEY", "")
-    binance_secret_key: str = os.getenv("BINANCE_SECRET_KEY", "")
-    environment: str = os.getenv("ENVIRONMENT", "development")  # development/production
+    # API Configuration (empty values are filled from the environment)
+    binance_api_key: str = ""
+    binance_secret_key: str = ""
+    environment: str = ""  # development/production
 
     # Trading Assets (simplified)
     grid_trading_assets: List[str] = None
 
-    # Core Configurations
-    grid_config: GridTradingConfig = None
-    risk_config: RiskManagementConfig = None
-
     # Logging
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    log_level: str = ""
     log_file: str = "data/logs/trading_bot.log"
 
     def __post_init__(self):
         """Initialize default configurations"""
+        # Read the environment per instance, not once at class definition
+        _load_env()
+        env = os.environ
+        self.binance_api_key = self.binance_api_key or env.get("BINANCE_API_KEY", "")
+        self.binance_secret_key = self.binance_secret_key or env.get(
+            "BINANCE_SECRET_KEY", ""
+        )
+        self.environment = self.environment or env.get("ENVIRONMENT", "development")
+        self.log_level = self.log_level or env.get("LOG_LEVEL", "INFO")
+
         if self.grid_trading_assets is None:
             self.grid_trading_assets = [
                 "ADA",
                 "AVAX",
             ]  # Match what you're actually trading
 
-        if self.grid_config is None:
-            self.grid_config = GridTradingConfig()
+    # Core Configurations - built on first access; assign to override
+    @cached_property
+    def grid_config(self) -> GridTradingConfig:
+        """Grid trading settings"""
+        return GridTradingConfig()
 
-        if self.risk_config is None:
-            self.risk_config = RiskManagementConfig()
+    @cached_property
+    def risk_config(self) -> RiskManagementConfig:
+        """Risk management settings"""
+        return RiskManagementConfig()
 
 
 # Global configuration instance
 config = TradingBotConfig()
 
+# Lookup tables below are read-only views so they can't be mutated at runtime
+
 # Simplified asset configurations - match your actual trading pairs
-ASSET_CONFIGS = {
-    "ADA": {
-        "grid_size_percent": 2.0,  # ✅ CHANGED: 2.5 → 2.0% spacing for ADA
-        "num_grids": 8,
-        "base_order_size": 100.0,
-        "symbol": "ADAUSDT",
-    },
-    "AVAX": {
-        "grid_size_percent": 2.0,  # ✅ KEPT: 2.0% spacing for AVAX
-        "num_grids": 8,
-        "base_order_size": 100.0,
-        "symbol": "AVAXUSDT",
-    },
-}
+ASSET_CONFIGS = MappingProxyType(
+    {
+        "ADA": MappingProxyType(
+            {
+                "grid_size_percent": 2.0,  # ✅ CHANGED: 2.5 → 2.0% spacing for ADA
+                "num_grids": 8,
+                "base_order_size": 100.0,
+                "symbol": "ADAUSDT",
+            }
+        ),
+        "AVAX": MappingProxyType(
+            {
+                "grid_size_percent": 2.0,  # ✅ KEPT: 2.0% spacing for AVAX
+                "num_grids": 8,
+                "base_order_size": 100.0,
+                "symbol": "AVAXUSDT",
+            }
+        ),
+    }
+)
 
 # Trading pairs configuration - match your test results
-TRADING_PAIRS = {"ADA": "ADAUSDT", "AVAX": "AVAXUSDT"}
+TRADING_PAIRS = MappingProxyType({"ADA": "ADAUSDT", "AVAX": "AVAXUSDT"})
 
 # Binance API configuration
-BINANCE_CONFIG = {
-    "base_url": "https://api.binance.com",
-    "testnet_url": "https://testnet.binance.vision",
-    "timeout": 10,
-    "recv_window": 5000,
-}
+BINANCE_CONFIG = MappingProxyType(
+    {
+        "base_url": "https://api.binance.com",
+        "testnet_url": "https://testnet.binance.vision",
+        "timeout": 10,
+        "recv_window": 5000,
+    }
+)
@@ -37,7 +37,7 @@ env_loaded = find_and_load_env()
 
 # Local imports
 from strategies.grid_trading import GridTrader
-from utils.binance_client import BinanceManager
+from utils.binance_client import BinanceManager, round_quantity
 from utils.compound_manager import CompoundManager
 from utils.risk_manager import RiskConfig, RiskManager
 
@@ -303,51 +303,37 @@ class TradingBot:
     async def check_grid_strategies(self):
         """Enhanced grid checking with auto-reset"""
         try:
-            # ADA Grid
-            try:
-                ada_price = self.binance.get_price("ADAUSDT")
-                if ada_price:
-                    self.logger.info(f"🔸 ADA: ${ada_price:.4f}")
+            grids = (("ADA", self.ada_grid), ("AVAX", self.avax_grid))
 
-                    # Check for grid reset first
-                    ada_reset = self.ada_grid.auto_reset_grid(ada_price)
-                    if ada_reset["reset"]:
-                        self.logger.info(
-                            f"🔄 ADA grid auto-reset: {ada_reset['reason']}"
-                        )
-
-                    ada_signals = self.ada_grid.check_signals(ada_price)
-                    for signal in ada_signals:
-                        success = await self.execute_smart_grid_order(
-                            self.ada_grid, signal
-                        )
-                        if success:
-                            break
-            except Exception as e:
-                self.logger.error(f"❌ ADA grid error: {e}")
-
-            # AVAX Grid
-            try:
-                avax_price = self.binance.get_price("AVAXUSDT")
-                if avax_price:
-                    self.logger.info(f"🔸 AVAX: ${avax_price:.4f}")
+            # Price lookups are blocking REST calls - run them concurrently
+            prices = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self.binance.get_price, grid.symbol)
+                    for _, grid in grids
+                )
+            )
 
-                    # Check for grid reset first
-                    avax_reset = self.avax_grid.auto_reset_grid(avax_price)
-                    if avax_reset["reset"]:
-                        self.logger.info(
-                            f"🔄 AVAX grid auto-reset: {avax_reset['reason']}"
-                        )
+            for (name, grid), price in zip(grids, prices):
+                try:
+                    if price:
+                        self.logger.info(f"🔸 {name}: ${price:.4f}")
+
+                        # Check for grid reset first
+                        reset = grid.auto_reset_grid(price)
+                        if reset["reset"]:
+                            self.logger.info(
+                                f"🔄 {name} grid auto-reset: {reset['reason']}"
+                            )
 
-                    avax_signals = self.avax_grid.check_signals(avax_price)
-                    for signal in avax_signals:
-                        success = await self.execute_smart_grid_order(
-                            self.avax_grid, signal
-                        )
-                        if success:
-                            break
-            except Exception as e:
-                self.logger.error(f"❌ AVAX grid error: {e}")
+                        signals = grid.check_signals(price)
+                        for signal in signals:
+                            success = await self.execute_smart_grid_order(
+                                grid, signal
+                            )
+                            if success:
+                                break
+                except Exception as e:
+                    self.logger.error(f"❌ {name} grid error: {e}")
 
         except Exception as e:
             self.logger.error(f"Grid strategy check failed: {e}")
@@ -417,10 +403,7 @@ class TradingBot:
                 return False
 
             # Precision fix
-            if symbol == "ADAUSDT":
-                quantity = round(quantity, 0)
-            elif symbol == "AVAXUSDT":
-                quantity = round(quantity, 2)
+            quantity = round_quantity(symbol, quantity)
 
             # Minimum order check
             current_price = self.binance.get_price(symbol)
@@ -528,7 +511,7 @@ class TradingBot:
                     "timestamp": time.time(),
                     "order_id": str(order_id),
                 }
-                grid_trader.filled_orders.append(filled_order)
+                grid_trader.record_filled_order(filled_order)
 
                 # Log success
                 profit_msg = (
@@ -629,6 +612,9 @@ class TradingBot:
         cycle_count = 0
 
         try:
+            # Batch routine notifications into fewer Telegram posts
+            self.telegram_notifier.start_batching()
+
             while True:
                 if self.running:
                     cycle_count += 1
@@ -711,10 +697,13 @@ class TradingBot:
                 self.session_id,
             )
 
+            # Flush batched messages first so the stop notice is posted directly
+            await self.telegram_notifier.stop_batching()
             if self.telegram_notifier.enabled:
                 await self.telegram_notifier.notify_info(
                     f"🛑 Bot Stopped - Final Order Size: ${compound_info['current_order_size']:.0f}"
                 )
+            self.telegram_notifier.close()
 
             self.logger.info("🛑 Enhanced bot stopped")
 
@@ -1,18 +1,47 @@
 # src/trading_bot/strategies/grid_trading.py
 import logging
 import time
-from typing import Dict, List
+from typing import Callable, Dict, List
 
-import pandas as pd
+import numpy as np
 
 
 class GridTrader:
+    __slots__ = (
+        "symbol",
+        "grid_size",
+        "num_grids",
+        "base_order_size",
+        "_buy_multipliers",
+        "_sell_multipliers",
+        "buy_levels",
+        "sell_levels",
+        "buy_prices",
+        "sell_prices",
+        "active_orders",
+        "filled_orders",
+        "_buy_filled_mask",
+        "_sell_filled_mask",
+        "_buy_filled_count",
+        "_sell_filled_count",
+        "_buy_fills",
+        "_sell_fills",
+        "_total_volume_usdt",
+        "logger",
+        "center_price",
+        "last_reset_time",
+        "recent_trades",
+        "trade_cooldown",
+        "_clock",
+    )
+
     def __init__(
         self,
         symbol: str,
         grid_size_percent: float = 2.0,
         num_grids: int = 8,
         base_order_size: float = 100.0,
+        clock: Callable[[], float] = time.time,
     ):
         """
         Grid Trading Strategy
@@ -22,17 +51,38 @@ class GridTrader:
             grid_size_percent: Percentage between grid levels (default 2%)
             num_grids: Number of grid levels (default 8)
             base_order_size: Base order size in USDT (default $100)
+            clock: Time source for reset/cooldown checks (default time.time)
         """
         self.symbol = symbol
         self.grid_size = grid_size_percent / 100  # Convert to decimal
         self.num_grids = num_grids
         self.base_order_size = base_order_size
 
+        # Level multipliers only depend on grid size/count, so compute once
+        steps = np.arange(1, num_grids + 1, dtype=np.float64)
+        self._buy_multipliers = 1.0 - self.grid_size * steps
+        self._sell_multipliers = 1.0 + self.grid_size * steps
+
         self.buy_levels = []
         self.sell_levels = []
+        self.buy_prices = np.empty(0)  # Level prices as arrays for signal checks
+        self.sell_prices = np.empty(0)
         self.active_orders = {}
         self.filled_orders = []
 
+        # Filled flag per grid level (index = level - 1), kept next to the price arrays
+        self._buy_filled_mask = np.zeros(num_grids, dtype=bool)
+        self._sell_filled_mask = np.zeros(num_grids, dtype=bool)
+
+        # Running fill statistics, updated by record_filled_order
+        self._buy_filled_count = 0
+        self._sell_filled_count = 0
+        self._total_volume_usdt = 0.0
+
+        # Per-side (price, quantity) rows of fills; the filled counts are the lengths
+        self._buy_fills = np.empty((16, 2))
+        self._sell_fills = np.empty((16, 2))
+
         self.logger = logging.getLogger(f"{__name__}.{symbol}")
 
         # Auto-reset attributes ✅ ADDED
@@ -41,28 +91,33 @@ class GridTrader:
 
         self.recent_trades = {}
         self.trade_cooldown = 30
+        self._clock = clock
 
     def setup_grid(self, current_price: float) -> Dict:
         """Setup grid levels around current price"""
         self.center_price = current_price  # ✅ ADDED for auto-reset
-        self.buy_levels = []
-        self.sell_levels = []
+
+        self.buy_prices = current_price * self._buy_multipliers
+        self.sell_prices = current_price * self._sell_multipliers
+        # Both sides size each level at that level's price
+        buy_quantities = np.round(self.base_order_size / self.buy_prices, 6)
+        sell_quantities = np.round(self.base_order_size / self.sell_prices, 6)
 
         # Create buy levels below current price
-        for i in range(1, self.num_grids + 1):
-            price = current_price * (1 - self.grid_size * i)
-            quantity = round(self.base_order_size / price, 6)
-            self.buy_levels.append(
-                {"price": price, "quantity": quantity, "level": i, "side": "BUY"}
+        self.buy_levels = [
+            {"price": price, "quantity": quantity, "level": i, "side": "BUY"}
+            for i, (price, quantity) in enumerate(
+                zip(self.buy_prices.tolist(), buy_quantities.tolist()), start=1
             )
+        ]
 
         # Create sell levels above current price
-        for i in range(1, self.num_grids + 1):
-            price = current_price * (1 + self.grid_size * i)
-            quantity = round(self.base_order_size / current_price, 6)
-            self.sell_levels.append(
-                {"price": price, "quantity": quantity, "level": i, "side": "SELL"}
+        self.sell_levels = [
+            {"price": price, "quantity": quantity, "level": i, "side": "SELL"}
+            for i, (price, quantity) in enumerate(
+                zip(self.sell_prices.tolist(), sell_quantities.tolist()), start=1
             )
+        ]
 
         grid_info = {
             "symbol": self.symbol,
@@ -73,44 +128,44 @@ class GridTrader:
             "grid_size_percent": self.grid_size * 100,
         }
 
-        self.logger.info(f"Grid setup complete: {grid_info}")
+        self.logger.info("Grid setup complete: %s", grid_info)
         return grid_info
 
     def check_signals(self, current_price: float) -> List[Dict]:
         """Check for grid trading signals"""
         signals = []
-
-        # Check buy levels
-        for level in self.buy_levels:
-            if current_price <= level["price"] and level["level"] not in [
-                o["level"] for o in self.filled_orders if o["side"] == "BUY"
-            ]:
-                signals.append(
-                    {
-                        "action": "BUY",
-                        "price": level["price"],
-                        "quantity": level["quantity"],
-                        "level": level["level"],
-                        "signal_strength": 0.7,
-                        "reason": f"Price hit buy grid level {level['level']}",
-                    }
-                )
+        if not self.buy_levels:  # Grid not set up yet
+            return signals
+
+        # Check buy levels (only triggered, unfilled levels are materialized)
+        buy_hits = (current_price <= self.buy_prices) & ~self._buy_filled_mask
+        for idx in np.flatnonzero(buy_hits):
+            level = self.buy_levels[idx]
+            signals.append(
+                {
+                    "action": "BUY",
+                    "price": level["price"],
+                    "quantity": level["quantity"],
+                    "level": level["level"],
+                    "signal_strength": 0.7,
+                    "reason": f"Price hit buy grid level {level['level']}",
+                }
+            )
 
         # Check sell levels
-        for level in self.sell_levels:
-            if current_price >= level["price"] and level["level"] not in [
-                o["level"] for o in self.filled_orders if o["side"] == "SELL"
-            ]:
-                signals.append(
-                    {
-                        "action": "SELL",
-                        "price": level["price"],
-                        "quantity": level["quantity"],
-                        "level": level["level"],
-                        "signal_strength": 0.7,
-                        "reason": f"Price hit sell grid level {level['level']}",
-                    }
-                )
+        sell_hits = (current_price >= self.sell_prices) & ~self._sell_filled_mask
+        for idx in np.flatnonzero(sell_hits):
+            level = self.sell_levels[idx]
+            signals.append(
+                {
+                    "action": "SELL",
+                    "price": level["price"],
+                    "quantity": level["quantity"],
+                    "level": level["level"],
+                    "signal_strength": 0.7,
+                    "reason": f"Price hit sell grid level {level['level']}",
+                }
+            )
 
         return signals
 
@@ -130,92 +185,93 @@ class GridTrader:
             # Check if order was successful
             if order and order.get("status") == "FILLED":
                 # Record filled order
-                self.filled_orders.append(
+                self.record_filled_order(
                     {
                         "symbol": symbol,
                         "side": action,
                         "quantity": quantity,
                         "price": signal["price"],
                         "level": signal["level"],
-                        "timestamp": pd.Timestamp.now(),
+                        "timestamp": time.time(),
                     }
                 )
 
                 self.logger.info(
-                    f"Grid order executed: {action} {quantity} {symbol} at level {signal['level']}"
+                    "Grid order executed: %s %s %s at level %s",
+                    action,
+                    quantity,
+                    symbol,
+                    signal["level"],
                 )
                 return True
             else:
-                self.logger.error(f"Grid order failed: {order}")
+                self.logger.error("Grid order failed: %s", order)
                 return False
 
         except Exception as e:
-            self.logger.error(f"Error executing grid order: {e}")
+            self.logger.error("Error executing grid order: %s", e)
             return False
 
-    def get_grid_status(self) -> Dict:
-        """Get current grid trading status with error handling"""
-        try:
-            buy_orders_filled = len(
-                [o for o in self.filled_orders if o.get("side") == "BUY"]
+    def record_filled_order(self, order: Dict) -> None:
+        """Append a filled order and update running fill statistics"""
+        self.filled_orders.append(order)
+
+        level = order.get("level")
+        in_grid = isinstance(level, int) and 1 <= level <= self.num_grids
+        if order["side"] == "BUY":
+            self._buy_fills = self._append_fill(
+                self._buy_fills, self._buy_filled_count, order
             )
-            sell_orders_filled = len(
-                [o for o in self.filled_orders if o.get("side") == "SELL"]
+            self._buy_filled_count += 1
+            if in_grid:
+                self._buy_filled_mask[level - 1] = True
+        elif order["side"] == "SELL":
+            self._sell_fills = self._append_fill(
+                self._sell_fills, self._sell_filled_count, order
             )
+            self._sell_filled_count += 1
+            if in_grid:
+                self._sell_filled_mask[level - 1] = True
 
-            total_volume = 0
-            for order in self.filled_orders:
-                try:
-                    if "total_value" in order:
-                        total_volume += order["total_value"]
-                    else:
-                        # Calculate from quantity and price
-                        qty = order.get("quantity", 0)
-                        price = order.get("price", 0)
-                        total_volume += qty * price
-                except:
-                    continue
-
-            return {
-                "symbol": self.symbol,
-                "buy_orders_filled": buy_orders_filled,
-                "sell_orders_filled": sell_orders_filled,
-                "total_orders": len(self.filled_orders),
-                "total_volume_usdt": total_volume,
-                "grid_levels": {
-                    "buy_levels": len(getattr(self, "buy_levels", [])),
-                    "sell_levels": len(getattr(self, "sell_levels", [])),
-                },
-            }
-        except Exception:
-            # Return safe defaults on error
-            return {
-                "symbol": getattr(self, "symbol", "UNKNOWN"),
-                "buy_orders_filled": 0,
-                "sell_orders_filled": 0,
-                "total_orders": 0,
-                "total_volume_usdt": 0,
-                "grid_levels": {"buy_levels": 0, "sell_levels": 0},
-            }
-
-    def calculate_grid_profit(self) -> float:
-        """Calculate profit from completed grid cycles"""
-        profit = 0.0
-
-        # Simple profit calculation: each buy-sell cycle
-        buy_orders = [o for o in self.filled_orders if o["side"] == "BUY"]
-        sell_orders = [o for o in self.filled_orders if o["side"] == "SELL"]
+        if "total_value" in order:
+            self._total_volume_usdt += order["total_value"]
+        else:
+            self._total_volume_usdt += order["quantity"] * order["price"]
 
-        # Match buy and sell orders for profit calculation
-        for i in range(min(len(buy_orders), len(sell_orders))):
-            buy_price = buy_orders[i]["price"]
-            sell_price = sell_orders[i]["price"]
-            quantity = min(buy_orders[i]["quantity"], sell_orders[i]["quantity"])
+    @staticmethod
+    def _append_fill(fills: np.ndarray, count: int, order: Dict) -> np.ndarray:
+        """Write a fill at row `count`, doubling the buffer when it is full"""
+        if count == len(fills):
+            fills = np.concatenate([fills, np.empty_like(fills)])
+        fills[count] = order["price"], order["quantity"]
+        return fills
 
-            cycle_profit = (sell_price - buy_price) * quantity
-            profit += cycle_profit
+    def get_grid_status(self) -> Dict:
+        """Get current grid trading status"""
+        return {
+            "symbol": self.symbol,
+            "buy_orders_filled": self._buy_filled_count,
+            "sell_orders_filled": self._sell_filled_count,
+            "total_orders": len(self.filled_orders),
+            "total_volume_usdt": self._total_volume_usdt,
+            "grid_levels": {
+                "buy_levels": len(self.buy_levels),
+                "sell_levels": len(self.sell_levels),
+            },
+        }
 
-        return profit
+    def calculate_grid_profit(self) -> float:
+        """Calculate profit from completed grid cycles"""
+        # Simple profit calculation: i-th buy matched with i-th sell
+        cycles = min(self._buy_filled_count, self._sell_filled_count)
+        if cycles == 0:
+            return 0.0
+
+        buys = self._buy_fills[:cycles]
+        sells = self._sell_fills[:cycles]
+        return float(
+            np.dot(sells[:, 0] - buys[:, 0], np.minimum(buys[:, 1], sells[:, 1]))
+        )
 
     # ✅ AUTO-RESET METHODS (Enhanced functionality)
     def should_reset_grid(self, current_price, grid_center=None, reset_threshold=0.15):
@@ -227,7 +283,7 @@ class GridTrader:
             return False
 
         price_deviation = abs(current_price - grid_center) / grid_center
-        time_since_reset = time.time() - self.last_reset_time
+        time_since_reset = self._clock() - self.last_reset_time
         min_reset_interval = 3600  # 1 hour
 
         return (
@@ -239,7 +295,7 @@ class GridTrader:
         if self.should_reset_grid(current_price, self.center_price):
             old_center = self.center_price
             self.setup_grid(current_price)
-            self.last_reset_time = time.time()
+            self.last_reset_time = self._clock()
 
             reset_info = {
                 "reset": True,
@@ -248,16 +304,14 @@ class GridTrader:
                 "reason": f"Price moved {abs(current_price - old_center) / old_center * 100:.1f}% from grid center",
             }
 
-            self.logger.info(f"🔄 Grid auto-reset: {reset_info['reason']}")
+            self.logger.info("🔄 Grid auto-reset: %s", reset_info["reason"])
             return reset_info
 
         return {"reset": False}
 
     def is_duplicate_trade(self, action, price, quantity):
-        import time
-
         trade_key = f"{action}_{price:.4f}_{quantity:.4f}"
-        current_time = time.time()
+        current_time = self._clock()
 
         if trade_key in self.recent_trades:
             time_since_trade = current_time - self.recent_trades[trade_key]
@@ -276,9 +330,14 @@ def test_grid_strategy():
     """Test grid strategy with sample data - ENHANCED"""
     print("🧪 Testing Enhanced GridTrader with Auto-Reset...")
 
-    # Create grid trader
+    # Create grid trader on a virtual clock so cooldowns need no real sleeps
+    now = [1_000_000.0]
     grid = GridTrader(
-        "ADAUSDT", grid_size_percent=2.0, num_grids=8, base_order_size=100
+        "ADAUSDT",
+        grid_size_percent=2.0,
+        num_grids=8,
+        base_order_size=100,
+        clock=lambda: now[0],
     )
 
     # Test 1: Setup grid
@@ -295,9 +354,7 @@ def test_grid_strategy():
     print(f"10% move reset: {reset_result['reset']} (expected: False)")
 
     # Large move (should reset)
-    import time
-
-    time.sleep(1)  # Avoid cooldown in test
+    now[0] += 3601  # Past the 1 hour reset interval
     reset_result = grid.auto_reset_grid(1.2)  # 20% move
     print(f"20% move reset: {reset_result['reset']} (expected: True)")
     if reset_result["reset"]:
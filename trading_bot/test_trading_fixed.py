@@ -5,21 +5,40 @@ Tests trading methods with minimum notional values
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-def test_trading_methods_properly():
+# Imported once per process rather than inside each check
+from utils.binance_client import BinanceManager
+
+
+@lru_cache(maxsize=1)
+def get_binance_manager():
+    """Shared client so the connection + timestamp sync happens only once"""
+    return BinanceManager()
+
+
+def get_current_prices():
+    """Fetch ADA and AVAX prices once for all checks"""
+    try:
+        bm = get_binance_manager()
+        return bm.get_price("ADAUSDT"), bm.get_price("AVAXUSDT")
+    except Exception as e:
+        print(f"❌ Error getting prices: {e}")
+        return None, None
+
+
+def test_trading_methods_properly(prices=None):
     """Test trading methods with proper order sizes"""
     try:
-        from utils.binance_client import BinanceManager
-        
         print("🧪 TESTING TRADING METHODS WITH PROPER SIZES")
         print("=" * 50)
         
         # Create manager instance
-        bm = BinanceManager()
+        bm = get_binance_manager()
         
         # Test connection first
         if not bm.test_connection():
@@ -29,8 +48,7 @@ def test_trading_methods_properly():
         print("✅ Binance connection successful")
         
         # Get current prices to calculate proper quantities
-        ada_price = bm.get_price("ADAUSDT")
-        avax_price = bm.get_price("AVAXUSDT")
+        ada_price, avax_price = prices or get_current_prices()
         
         if not ada_price or not avax_price:
             print("❌ Could not get current prices")
@@ -93,16 +111,12 @@ def test_trading_methods_properly():
         traceback.print_exc()
         return False
 
-def check_minimum_notional_requirements():
+def check_minimum_notional_requirements(prices=None):
     """Check minimum order requirements for your trading pairs"""
     try:
-        from utils.binance_client import BinanceManager
-        
         print("\n💰 CHECKING MINIMUM ORDER REQUIREMENTS")
         print("=" * 50)
         
-        bm = BinanceManager()
-        
         # Get exchange info for minimum requirements
         print("📋 Minimum order requirements (approximate):")
         print("   ADAUSDT: ~$5-10 USD minimum")
@@ -110,8 +124,7 @@ def check_minimum_notional_requirements():
         print("   Your orders: $50 USD ✅ Well above minimum")
         
         # Calculate your actual order values
-        ada_price = bm.get_price("ADAUSDT")
-        avax_price = bm.get_price("AVAXUSDT")
+        ada_price, avax_price = prices or get_current_prices()
         
         if ada_price and avax_price:
             # Your bot's order sizes
@@ -223,32 +236,41 @@ def main():
     print("🔧 FIXED BINANCE TRADING METHODS TEST")
     print("=" * 60)
     
+    # Fetch prices once and share them between both checks
+    prices = get_current_prices()
+
     # Check minimum requirements first
-    check_minimum_notional_requirements()
+    check_minimum_notional_requirements(prices)
     
     # Test with proper order sizes
-    success = test_trading_methods_properly()
+    success = test_trading_methods_properly(prices)
     
+    # Build the summary once and emit it in a single write
     if success:
-        print(f"\n🎉 TESTS SUCCESSFUL!")
-        print("✅ Trading methods are working correctly")
-        print("✅ Order sizes meet minimum requirements")
-        print("✅ Your bot should now execute trades properly")
-        
-        print(f"\n🚀 NEXT STEPS:")
-        print("1. Your trading methods are fixed!")
-        print("2. The NOTIONAL error was just from testing with tiny amounts")
-        print("3. Your $50 orders will work perfectly")
-        print("4. Restart your bot: python3 main.py")
-        print("5. Watch for successful trade executions! 📈")
-        
+        summary = [
+            "\n🎉 TESTS SUCCESSFUL!",
+            "✅ Trading methods are working correctly",
+            "✅ Order sizes meet minimum requirements",
+            "✅ Your bot should now execute trades properly",
+            "\n🚀 NEXT STEPS:",
+            "1. Your trading methods are fixed!",
+            "2. The NOTIONAL error was just from testing with tiny amounts",
+            "3. Your $50 orders will work perfectly",
+            "4. Restart your bot: python3 main.py",
+            "5. Watch for successful trade executions! 📈",
+        ]
     else:
-        print(f"\n❌ TESTS FAILED")
-        print("There may be other issues to investigate")
-    
-    print(f"\n💡 IMPROVED METHODS (optional upgrade):")
-    print("If you want better error handling, replace your methods with:")
-    print(create_improved_trading_methods())
+        summary = [
+            "\n❌ TESTS FAILED",
+            "There may be other issues to investigate",
+        ]
+
+    summary += [
+        "\n💡 IMPROVED METHODS (optional upgrade):",
+        "If you want better error handling, replace your methods with:",
+        create_improved_trading_methods(),
+    ]
+    print("\n".join(summary))
 
 if __name__ == "__main__":
     main()
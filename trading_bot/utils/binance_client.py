@@ -3,6 +3,7 @@
 import logging
 import os
 import time
+from functools import cache
 from pathlib import Path
 
 import requests
@@ -10,9 +11,27 @@ from binance.client import Client
 from dotenv import load_dotenv
 
 
+# Quantity decimals per symbol (Binance LOT_SIZE step); others default to 2
+QUANTITY_PRECISION = {
+    "ADAUSDT": 0,  # Whole numbers
+    "AVAXUSDT": 2,
+}
+
+
+def round_quantity(symbol: str, quantity: float) -> float:
+    """Round an order quantity to the symbol's lot precision"""
+    return round(float(quantity), QUANTITY_PRECISION.get(symbol, 2))
+
+
+@cache
+def _load_env():
+    """Parse the project .env once per process"""
+    load_dotenv(Path(__file__).parent.parent.parent / ".env")
+
+
 class BinanceManager:
     def __init__(self):
-        load_dotenv(Path(__file__).parent.parent.parent / ".env")
+        _load_env()
         self.api_key = os.getenv("BINANCE_API_KEY")
         self.secret_key = os.getenv("BINANCE_SECRET_KEY")
         self.testnet = os.getenv("ENVIRONMENT", "development") == "development"
@@ -31,9 +50,13 @@ class BinanceManager:
                     if self.testnet
                     else "https://api.binance.com"
                 )
+                # Compare against the local midpoint of the round-trip
+                # (Cristian's algorithm) so the offset isn't skewed by RTT/2
+                sent_ns = time.time_ns()
                 server_response = requests.get(f"{base_url}/api/v3/time", timeout=10)
+                received_ns = time.time_ns()
                 server_time = server_response.json()["serverTime"]
-                local_time = int(time.time() * 1000)
+                local_time = (sent_ns + received_ns) // 2_000_000
 
                 # Set client timestamp offset
                 self.client.timestamp_offset = server_time - local_time
@@ -138,12 +161,7 @@ class BinanceManager:
         """Place market buy order with precision handling"""
         try:
             # Round to correct precision FIRST
-            if symbol == "ADAUSDT":
-                quantity = round(float(quantity), 0)  # Whole numbers
-            elif symbol == "AVAXUSDT":
-                quantity = round(float(quantity), 2)  # 2 decimals
-            else:
-                quantity = round(float(quantity), 2)  # Default 2 decimals
+            quantity = round_quantity(symbol, quantity)
 
             # Validate order value
             current_price = self.get_price(symbol)
@@ -185,12 +203,7 @@ class BinanceManager:
         """Place market sell order with precision handling"""
         try:
             # Round to correct precision FIRST
-            if symbol == "ADAUSDT":
-                quantity = round(float(quantity), 0)  # Whole numbers
-            elif symbol == "AVAXUSDT":
-                quantity = round(float(quantity), 2)  # 2 decimals
-            else:
-                quantity = round(float(quantity), 2)  # Default 2 decimals
+            quantity = round_quantity(symbol, quantity)
 
             # Validate order value
             current_price = self.get_price(symbol)
@@ -2,6 +2,7 @@
 """Simple and Safe Compound Interest Implementation - CLEAN"""
 
 import logging
+from collections import deque
 from pathlib import Path
 from typing import Dict
 
@@ -23,25 +24,24 @@ class CompoundManager:
         self.accumulated_profit = 0.0
         self.current_order_multiplier = 1.0
 
-        self.logger.info(f"🔄 Compound manager initialized - Base: ${base_order_size}")
+        self.logger.info("🔄 Compound manager initialized - Base: $%s", base_order_size)
 
     def load_state_from_database(
         self, db_path: str = "trading_bot/data/trading_history.db"
     ):
         """Load compound state from profit data in database"""
-        self.logger.info(f"🔄 Loading compound state from {db_path}")
+        self.logger.info("🔄 Loading compound state from %s", db_path)
 
         try:
             import sqlite3
 
-            # Ensure absolute path resolution
-            if not Path(db_path).is_absolute():
-                abs_db_path = Path.cwd() / db_path
-            else:
-                abs_db_path = Path(db_path)
+            # Ensure absolute path resolution (one Path object, one stat call)
+            abs_db_path = Path(db_path)
+            if not abs_db_path.is_absolute():
+                abs_db_path = Path.cwd() / abs_db_path
 
-            self.logger.info(f"🔄 Using absolute path: {abs_db_path}")
-            self.logger.info(f"🔄 Database exists: {abs_db_path.exists()}")
+            self.logger.info("🔄 Using absolute path: %s", abs_db_path)
+            self.logger.info("🔄 Database exists: %s", abs_db_path.exists())
 
             with sqlite3.connect(str(abs_db_path)) as conn:
                 # Get all trades for FIFO calculation
@@ -51,24 +51,19 @@ class CompoundManager:
                     ORDER BY timestamp ASC
                 """)
 
-                trades = cursor.fetchall()
-                self.logger.info(f"🔄 Found {len(trades)} trades")
-
-                if len(trades) == 0:
-                    self.logger.info("🔄 No trades found, using base settings")
-                    return
-
-                # FIFO profit calculation
+                # FIFO profit calculation, streaming rows from the cursor
                 open_buys = {}
                 total_profit = 0.0
                 profitable_sells = 0
+                trade_count = 0
 
-                for trade in trades:
+                for trade in cursor:
+                    trade_count += 1
                     symbol, side, quantity, price, timestamp = trade
 
                     if side == "BUY":
                         if symbol not in open_buys:
-                            open_buys[symbol] = []
+                            open_buys[symbol] = deque()
                         open_buys[symbol].append({"qty": quantity, "price": price})
 
                     elif side == "SELL":
@@ -91,13 +86,19 @@ class CompoundManager:
                             buy["qty"] -= match_qty
 
                             if buy["qty"] <= 0:
-                                open_buys[symbol].pop(0)
+                                open_buys[symbol].popleft()
 
                         if sell_profit > 0:
                             profitable_sells += 1
 
-                self.logger.info(f"🔄 Calculated profit: ${total_profit:.4f}")
-                self.logger.info(f"🔄 Profitable sells: {profitable_sells}")
+                self.logger.info("🔄 Found %s trades", trade_count)
+
+                if trade_count == 0:
+                    self.logger.info("🔄 No trades found, using base settings")
+                    return
+
+                self.logger.info("🔄 Calculated profit: $%.4f", total_profit)
+                self.logger.info("🔄 Profitable sells: %s", profitable_sells)
 
                 # Apply compound interest if above threshold
                 if total_profit >= self.min_profit_threshold:
@@ -112,25 +113,29 @@ class CompoundManager:
 
                     self.current_order_multiplier = new_multiplier
 
-                    self.logger.info(f"🔄 Profit factor: {profit_factor:.6f}")
-                    self.logger.info(f"🔄 New multiplier: {new_multiplier:.6f}")
+                    self.logger.info("🔄 Profit factor: %.6f", profit_factor)
+                    self.logger.info("🔄 New multiplier: %.6f", new_multiplier)
                     self.logger.info(
-                        f"🔄 New order size: ${self.base_order_size * new_multiplier:.2f}"
+                        "🔄 New order size: $%.2f", self.base_order_size * new_multiplier
                     )
 
                     self.logger.info(
-                        f"✅ Loaded compound state - ${total_profit:.2f} profit, {new_multiplier:.3f}x multiplier"
+                        "✅ Loaded compound state - $%.2f profit, %.3fx multiplier",
+                        total_profit,
+                        new_multiplier,
                     )
                 else:
                     self.logger.info(
-                        f"📊 Profit ${total_profit:.2f} below ${self.min_profit_threshold:.2f} threshold"
+                        "📊 Profit $%.2f below $%.2f threshold",
+                        total_profit,
+                        self.min_profit_threshold,
                     )
 
         except Exception as e:
-            self.logger.error(f"❌ Compound loading failed: {e}")
+            self.logger.error("❌ Compound loading failed: %s", e)
             import traceback
 
-            self.logger.error(f"❌ Traceback: {traceback.format_exc()}")
+            self.logger.error("❌ Traceback: %s", traceback.format_exc())
             self.logger.info("📊 Using default compound settings")
 
     def record_trade_profit(self, symbol: str, side: str, profit: float) -> None:
@@ -155,11 +160,13 @@ class CompoundManager:
                 self._update_order_sizes()
 
                 self.logger.info(
-                    f"💰 Profit accumulated: ${profit:.2f} (Total: ${self.accumulated_profit:.2f})"
+                    "💰 Profit accumulated: $%.2f (Total: $%.2f)",
+                    profit,
+                    self.accumulated_profit,
                 )
 
         except Exception as e:
-            self.logger.error(f"Error recording profit: {e}")
+            self.logger.error("Error recording profit: %s", e)
 
     def _update_order_sizes(self) -> None:
         """Update order sizes based on accumulated profit"""
@@ -200,11 +207,11 @@ class CompoundManager:
                 )
 
                 self.logger.info(
-                    f"🔄 Compound adjustment: {old_multiplier:.2f}x → {new_multiplier:.2f}x"
+                    "🔄 Compound adjustment: %.2fx → %.2fx", old_multiplier, new_multiplier
                 )
 
         except Exception as e:
-            self.logger.error(f"Error updating order sizes: {e}")
+            self.logger.error("Error updating order sizes: %s", e)
 
     def get_current_order_size(self) -> float:
         """Get current order size with compound interest applied"""
@@ -245,5 +252,7 @@ class CompoundManager:
         )
 
         self.logger.warning(
-            f"🔄 Compound reset - was ${old_profit:.2f} profit, {old_multiplier:.2f}x multiplier"
+            "🔄 Compound reset - was $%.2f profit, %.2fx multiplier",
+            old_profit,
+            old_multiplier,
         )
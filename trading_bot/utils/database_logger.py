@@ -62,6 +62,10 @@ class DatabaseLogger:
                 conn.execute(
                     "CREATE INDEX IF NOT EXISTS idx_events_timestamp ON bot_events(timestamp)"
                 )
+                # Side-filtered, time-windowed aggregates (e.g. recent SELL stats)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_trades_side_ts ON trades(side, timestamp)"
+                )
 
                 conn.commit()
                 print(f"✅ Minimal database initialized: {self.db_path}")
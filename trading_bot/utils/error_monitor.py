@@ -6,6 +6,7 @@ Only alerts on critical warnings/errors that prevent trading
 
 import asyncio
 import logging
+import re
 from datetime import datetime, timedelta
 from collections import defaultdict
 from typing import Dict, List
@@ -32,6 +33,12 @@ class CriticalErrorMonitor:
             'bot_crash': ['crash', 'exception', 'stopped unexpectedly']
         }
         
+        # One alternation per category so each message is scanned once per category
+        self._critical_regexes = [
+            (category, re.compile("|".join(map(re.escape, patterns))))
+            for category, patterns in self.critical_patterns.items()
+        ]
+        
         self.monitoring_active = False
     
     def start_monitoring(self):
@@ -48,8 +55,8 @@ class CriticalErrorMonitor:
         """Check if error message indicates critical trading issue"""
         message_lower = message.lower()
         
-        for category, patterns in self.critical_patterns.items():
-            if any(pattern in message_lower for pattern in patterns):
+        for category, regex in self._critical_regexes:
+            if regex.search(message_lower):
                 return category
         
         return None
@@ -2,29 +2,89 @@
 import pandas as pd
 import numpy as np
 
+def _rolling_sum(values, window):
+    """Trailing window sums down the rows (axis 0) from a single cumulative sum.
+
+    Warm-up entries and windows containing NaN are NaN, like pandas rolling.
+    """
+    missing = np.isnan(values)
+    csum = np.cumsum(np.where(missing, 0.0, values), axis=0)
+    sums = np.full(values.shape, np.nan)
+    if values.shape[0] >= window:
+        sums[window - 1] = csum[window - 1]
+        sums[window:] = csum[window:] - csum[:-window]
+        if missing.any():
+            sums[_rolling_sum(missing.astype(np.float64), window) > 0] = np.nan
+    return sums
+
+def _rolling_mean(values, window):
+    """Trailing window mean of a float array"""
+    return _rolling_sum(values, window) / window
+
+def _as_array(data):
+    """Float64 view of a Series, DataFrame or 1-D/2-D array-like input.
+
+    Rows are bars; 2-D input is treated column by column.
+    """
+    values = np.asarray(data, dtype=np.float64)
+    if values.ndim not in (1, 2):
+        raise ValueError(f"Indicators take 1-D or 2-D data, got {values.ndim}-D")
+    return values
+
+def _as_series(values, like):
+    """Wrap an indicator array back onto the input Series or DataFrame labels.
+
+    Plain array inputs get plain arrays back, so callers can skip pandas.
+    """
+    if isinstance(like, pd.DataFrame):
+        return pd.DataFrame(values, index=like.index, columns=like.columns)
+    if isinstance(like, pd.Series):
+        return pd.Series(values, index=like.index, name=like.name)
+    return values
+
 def sma(data, window):
     """Simple Moving Average"""
-    return data.rolling(window=window).mean()
+    return _as_series(_rolling_mean(_as_array(data), window), data)
 
 def ema(data, window):
     """Exponential Moving Average"""
-    return data.ewm(span=window, adjust=False).mean()
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        return data.ewm(span=window, adjust=False).mean()
+    # The recursion stays in pandas; arrays just round-trip through it
+    values = _as_array(data)
+    frame = pd.Series(values) if values.ndim == 1 else pd.DataFrame(values)
+    return frame.ewm(span=window, adjust=False).mean().to_numpy()
 
 def rsi(data, window=14):
     """Relative Strength Index"""
-    delta = data.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
+    # Gains and losses averaged together in one cumulative pass
+    values = _as_array(data)
+    delta = np.diff(values, axis=0, prepend=np.full((1,) + values.shape[1:], np.nan))
+    moves = np.stack([np.where(delta > 0, delta, 0.0), np.where(delta < 0, -delta, 0.0)], axis=-1)
+    averages = _rolling_mean(moves, window)
+    gain, loss = averages[..., 0], averages[..., 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = gain / loss
+    return _as_series(100 - (100 / (1 + rs)), data)
 
 def bollinger_bands(data, window=20, num_std=2):
     """Bollinger Bands - returns upper, middle, lower"""
-    rolling_mean = data.rolling(window=window).mean()
-    rolling_std = data.rolling(window=window).std()
+    # Per-window mean and sample variance (ddof=1) over strided views; a
+    # cumulative sum of squares loses precision on long or high-priced series
+    values = _as_array(data)
+    rolling_mean = np.full(values.shape, np.nan)
+    rolling_std = np.full(values.shape, np.nan)
+    if values.shape[0] >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+        rolling_mean[window - 1:] = windows.mean(axis=-1)
+        rolling_std[window - 1:] = np.sqrt(windows.var(axis=-1, ddof=1))
     upper = rolling_mean + (rolling_std * num_std)
     lower = rolling_mean - (rolling_std * num_std)
-    return upper, rolling_mean, lower
+    return (
+        _as_series(upper, data),
+        _as_series(rolling_mean, data),
+        _as_series(lower, data),
+    )
 
 def macd(data, fast=12, slow=26, signal=9):
     """MACD - returns macd_line, signal_line, histogram"""
@@ -37,8 +97,9 @@ def macd(data, fast=12, slow=26, signal=9):
 
 def volume_spike(volume, window=20, threshold=2.0):
     """Detect volume spikes"""
-    volume_ma = volume.rolling(window=window).mean()
-    return volume > (volume_ma * threshold)
+    values = _as_array(volume)
+    spikes = values > (_rolling_mean(values, window) * threshold)
+    return _as_series(spikes, volume)
 
 # Test function
 def test_indicators():
@@ -61,6 +122,30 @@ def test_indicators():
     
     vol_spike = volume_spike(volumes, 10)
     print(f"Volume spikes: {vol_spike.sum()}")
+
+    # Bands must track pandas on long, high-priced and flat series
+    rng = np.random.default_rng(7)
+    long_prices = pd.Series(60000 + np.cumsum(rng.normal(0, 50, 200_000)))
+    low_vol = pd.Series(1.0 + rng.normal(0, 1e-6, 5_000))
+    flat = pd.Series(np.full(100, 0.1))
+    for series in (long_prices, low_vol, flat):
+        upper, mid, _ = bollinger_bands(series, 20)
+        std = series.rolling(20).std()
+        assert np.allclose(mid, series.rolling(20).mean(), rtol=1e-12, equal_nan=True)
+        assert np.allclose((upper - mid) / 2, std, rtol=1e-7, atol=1e-12, equal_nan=True)
+    assert np.allclose(bollinger_bands(flat, 20)[0].dropna(), 0.1, rtol=0, atol=1e-15)
+
+    # Frames roll per column, like pandas
+    frame = pd.DataFrame({"a": np.arange(1.0, 11.0), "b": np.arange(10.0, 110.0, 10.0)})
+    assert np.allclose(sma(frame, 5), frame.rolling(5).mean(), equal_nan=True)
+    assert isinstance(sma(frame, 5), pd.DataFrame)
+    assert isinstance(volume_spike(frame, 5), pd.DataFrame)
+    assert np.allclose(rsi(frame, 3), rsi(frame["a"], 3).to_numpy()[:, None], equal_nan=True)
+
+    # Plain arrays give plain arrays with the same values
+    macd_array = macd(prices.to_numpy())[0]
+    assert isinstance(macd_array, np.ndarray)
+    assert np.allclose(macd_array, macd_line)
     
     print("✅ All indicators working!")
 
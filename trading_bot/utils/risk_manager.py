@@ -13,7 +13,7 @@ class TradingMode(Enum):
     EMERGENCY_STOP = "EMERGENCY_STOP"
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskConfig:
     """Minimal risk configuration - essential limits only"""
 
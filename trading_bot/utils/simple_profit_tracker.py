@@ -1,5 +1,6 @@
 import sqlite3
-from typing import Dict
+from collections import deque
+from typing import Dict, Optional
 
 
 class SimpleProfitTracker:
@@ -23,20 +24,18 @@ class SimpleProfitTracker:
                     ORDER BY timestamp ASC
                 """)
 
-                trades = cursor.fetchall()
-
-                # Track open buys per symbol
+                # Track open buys per symbol (deque: O(1) FIFO pops)
                 open_buys = {}
                 total_profit = 0.0
                 completed_trades = 0
 
-                for trade in trades:
+                for trade in cursor:  # Stream rows rather than fetchall()
                     symbol, side, quantity, price, timestamp = trade
 
                     if side == "BUY":
                         # Add to open buys
                         if symbol not in open_buys:
-                            open_buys[symbol] = []
+                            open_buys[symbol] = deque()
                         open_buys[symbol].append(
                             {"qty": quantity, "price": price, "timestamp": timestamp}
                         )
@@ -66,7 +65,7 @@ class SimpleProfitTracker:
 
                             # Remove buy if fully used
                             if buy["qty"] <= 0:
-                                open_buys[symbol].pop(0)
+                                open_buys[symbol].popleft()
 
                 return {
                     "total_profit": round(total_profit, 2),
@@ -85,31 +84,19 @@ class SimpleProfitTracker:
         """Get profit statistics for recent time period"""
         try:
             with sqlite3.connect(self.db_path) as conn:
-                # Get trades from last N hours
+                # Aggregate SELLs from the last N hours inside SQLite
+                # Simple approximation: assume 2% profit per sell
+                # This could be made more accurate with full FIFO tracking
                 cursor = conn.execute(
                     """
-                    SELECT symbol, side, quantity, price, timestamp 
+                    SELECT COALESCE(SUM(quantity * price), 0) * 0.02, COUNT(*)
                     FROM trades 
-                    WHERE timestamp >= datetime('now', '-{} hours')
-                    ORDER BY timestamp ASC
-                """.format(hours)
+                    WHERE side = 'SELL' AND timestamp >= datetime('now', ?)
+                """,
+                    (f"-{float(hours)} hours",),
                 )
 
-                trades = cursor.fetchall()
-
-                # Use same FIFO logic but for recent trades only
-                # (This is a simplified version - could be more sophisticated)
-                recent_profit = 0.0
-                recent_trades = 0
-
-                for trade in trades:
-                    symbol, side, quantity, price, timestamp = trade
-                    if side == "SELL":
-                        # Simple approximation: assume 2% profit per sell
-                        # This could be made more accurate with full FIFO tracking
-                        estimated_profit = quantity * price * 0.02
-                        recent_profit += estimated_profit
-                        recent_trades += 1
+                recent_profit, recent_trades = cursor.fetchone()
 
                 return {
                     "recent_profit": round(recent_profit, 2),
@@ -155,8 +142,8 @@ class SimpleProfitTracker:
 
                 conn.commit()
 
-                # Calculate profit using FIFO method
-                profit = self._calculate_fifo_profit(symbol, quantity, price)
+                # Calculate profit using FIFO method on the same connection
+                profit = self._calculate_fifo_profit(symbol, quantity, price, conn)
                 print(
                     f"✅ Recorded SELL: {quantity} {symbol} @ ${price:.4f} (Profit: ${profit:.2f})"
                 )
@@ -168,39 +155,51 @@ class SimpleProfitTracker:
             return 0.0
 
     def _calculate_fifo_profit(
-        self, symbol: str, sell_quantity: float, sell_price: float
+        self,
+        symbol: str,
+        sell_quantity: float,
+        sell_price: float,
+        conn: Optional[sqlite3.Connection] = None,
     ) -> float:
-        """Calculate profit using FIFO (First In, First Out) method"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Get all buy orders for this symbol, oldest first
-                cursor = conn.execute(
-                    """
-                    SELECT quantity, price, timestamp FROM trades 
-                    WHERE symbol = ? AND side = 'BUY'
-                    ORDER BY timestamp ASC
-                """,
-                    (symbol,),
-                )
-
-                buys = cursor.fetchall()
-                remaining_sell_qty = sell_quantity
-                total_profit = 0.0
+        """Calculate profit using FIFO (First In, First Out) method
 
-                for buy_qty, buy_price, timestamp in buys:
-                    if remaining_sell_qty <= 0:
-                        break
-
-                    # How much can we match with this buy?
-                    match_qty = min(buy_qty, remaining_sell_qty)
-
-                    # Calculate profit for this match
-                    profit = (sell_price - buy_price) * match_qty
-                    total_profit += profit
-
-                    remaining_sell_qty -= match_qty
-
-                return total_profit
+        Reuses the caller's connection when given, otherwise opens one.
+        """
+        try:
+            if conn is None:
+                with sqlite3.connect(self.db_path) as conn:
+                    return self._calculate_fifo_profit(
+                        symbol, sell_quantity, sell_price, conn
+                    )
+
+            # Get all buy orders for this symbol, oldest first
+            cursor = conn.execute(
+                """
+                SELECT quantity, price, timestamp FROM trades 
+                WHERE symbol = ? AND side = 'BUY'
+                ORDER BY timestamp ASC
+            """,
+                (symbol,),
+            )
+
+            remaining_sell_qty = sell_quantity
+            total_profit = 0.0
+
+            # Rows are streamed, so matching stops reading once the sell is filled
+            for buy_qty, buy_price, timestamp in cursor:
+                if remaining_sell_qty <= 0:
+                    break
+
+                # How much can we match with this buy?
+                match_qty = min(buy_qty, remaining_sell_qty)
+
+                # Calculate profit for this match
+                profit = (sell_price - buy_price) * match_qty
+                total_profit += profit
+
+                remaining_sell_qty -= match_qty
+
+            return total_profit
 
         except Exception as e:
             print(f"❌ FIFO calculation failed: {e}")
@@ -504,20 +504,20 @@ class TelegramBotCommands:
             display = f"**{symbol} Grid (Current: ${current_price:.4f})**\n"
             display += "```\n"
 
+            # Filled levels per side, collected in one pass over the fills
+            filled_levels = {"BUY": set(), "SELL": set()}
+            for order in grid_trader.filled_orders:
+                side_levels = filled_levels.get(order.get("side"))
+                if side_levels is not None:
+                    side_levels.add(order.get("level"))
+
             # Show sell levels (above current price)
-            sell_levels = sorted(
-                grid_trader.sell_levels, key=lambda x: x["price"], reverse=True
-            )
-            for level in sell_levels[:6]:  # Show top 6 sell levels
+            # setup_grid builds sell levels in ascending price order
+            for level in grid_trader.sell_levels[::-1][:6]:  # Show top 6 sell levels
                 price = level["price"]
                 distance = ((price - current_price) / current_price) * 100
                 filled_marker = (
-                    "✅"
-                    if any(
-                        o.get("level") == level["level"] and o.get("side") == "SELL"
-                        for o in grid_trader.filled_orders
-                    )
-                    else "⬜"
+                    "✅" if level["level"] in filled_levels["SELL"] else "⬜"
                 )
                 display += f"SELL ${price:.4f} ↑{distance:+5.1f}% {filled_marker}\n"
 
@@ -527,19 +527,12 @@ class TelegramBotCommands:
             display += "─" * 35 + "\n"
 
             # Show buy levels (below current price)
-            buy_levels = sorted(
-                grid_trader.buy_levels, key=lambda x: x["price"], reverse=True
-            )
-            for level in buy_levels[:6]:  # Show top 6 buy levels
+            # Buy levels are already in descending price order
+            for level in grid_trader.buy_levels[:6]:  # Show top 6 buy levels
                 price = level["price"]
                 distance = ((price - current_price) / current_price) * 100
                 filled_marker = (
-                    "✅"
-                    if any(
-                        o.get("level") == level["level"] and o.get("side") == "BUY"
-                        for o in grid_trader.filled_orders
-                    )
-                    else "⬜"
+                    "✅" if level["level"] in filled_levels["BUY"] else "⬜"
                 )
                 display += f"BUY  ${price:.4f} {distance:+5.1f}% {filled_marker}\n"
 
@@ -653,27 +646,27 @@ class TelegramBotCommands:
                 self.trading_bot.session_id,
             )
 
-            # Execute command
-            for command, handler in self.commands.items():
-                if text.startswith(command):
-                    print(f"📱 Executing: {command}")
-                    try:
-                        await handler(message)
-                    except Exception as e:
-                        print(f"Command error {command}: {e}")
-                        await self.send_reply(message, f"❌ Error: {str(e)[:50]}")
-                    break
-            else:
-                if text.startswith("/"):
-                    await self.send_reply(message, "❓ Unknown command. Try /help")
+            # Execute command - direct lookup on the first word (minus @botname)
+            command = text.split(maxsplit=1)[0].split("@", 1)[0] if text else ""
+            handler = self.commands.get(command)
+            if handler:
+                print(f"📱 Executing: {command}")
+                try:
+                    await handler(message)
+                except Exception as e:
+                    print(f"Command error {command}: {e}")
+                    await self.send_reply(message, f"❌ Error: {str(e)[:50]}")
+            elif text.startswith("/"):
+                await self.send_reply(message, "❓ Unknown command. Try /help")
 
         except Exception as e:
             print(f"Update handling error: {e}")
 
     def _is_rate_limited(self, user_id: int, command: str) -> bool:
         """Simple rate limiting"""
-        now = time.time()
-        key = f"{user_id}_{command}"
+        # Monotonic so wall-clock steps can't unblock or lock out a user
+        now = time.monotonic()
+        key = (user_id, command)
 
         if key in self.rate_limit:
             if now - self.rate_limit[key] < 2:
@@ -1,11 +1,14 @@
 # src/trading_bot/utils/telegram_notifier.py
 import asyncio
 import os
-from datetime import datetime
+import random
+import time
+from collections import deque
 from enum import Enum
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class NotificationType(Enum):
@@ -24,6 +27,33 @@ class NotificationType(Enum):
     INFO = "ℹ️"
 
 
+# Plain-dict lookups for the per-message hot path
+_EMOJI = {nt: nt.value for nt in NotificationType}
+
+_BOT_STATUS_TITLES = {
+    NotificationType.BOT_START: "🚀 Trading Bot Started",
+    NotificationType.BOT_STOP: "🛑 Trading Bot Stopped",
+    NotificationType.BOT_ERROR: "💥 Trading Bot Error",
+}
+_BOT_STATUS_TYPES = {
+    **dict.fromkeys(("start", "started", "startup"), NotificationType.BOT_START),
+    **dict.fromkeys(("stop", "stopped", "shutdown"), NotificationType.BOT_STOP),
+    **dict.fromkeys(("error", "crash", "exception"), NotificationType.BOT_ERROR),
+}
+
+# Last formatted HH:MM:SS, recomputed at most once per second
+_timestamp_cache = [0, ""]
+
+
+def _clock_time() -> str:
+    """Local wall-clock time as HH:MM:SS, cached per second"""
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    return _timestamp_cache[1]
+
+
 class TelegramNotifier:
     """Simplified Telegram notification system - database logging focused"""
 
@@ -35,11 +65,21 @@ class TelegramNotifier:
 
         # Notification settings
         self.max_message_length = 4096
-        self.retry_attempts = 3
-        self.retry_delay = 1
-
-        # Rate limiting
-        self.last_notification_time = {}
+        self.retry_attempts = 5
+        self.retry_delay = 0.5  # Backoff base; doubles per attempt with full jitter
+        self.retry_max_delay = 30
+
+        # Batching: queued messages are coalesced into one post per window
+        self.batch_interval_seconds = 5.0
+        self.batch_max_messages = 20
+        self.batch_max_chars = 3800
+        self.batch_separator = "\n---\n"
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+
+        # Rate limiting: at most max_per_window sends per type in each sliding window
+        self.max_per_window = 1
+        self._sent_times: Dict[NotificationType, deque] = {}
         self.min_interval_seconds = {
             NotificationType.TRADE_ATTEMPT: 0,
             NotificationType.TRADE_SUCCESS: 0,
@@ -50,12 +90,129 @@ class TelegramNotifier:
         }
 
         self.connection_tested = False
+        self._session = None  # Keep-alive HTTP session, created on first request
 
         if self.enabled:
             print("✅ Simplified Telegram notifier initialized")
         else:
             print("⚠️ Telegram notifier disabled - missing credentials")
 
+    def _get_session(self) -> requests.Session:
+        """Shared session so TLS connections to Telegram are reused"""
+        if self._session is None:
+            session = requests.Session()
+            session.mount(
+                "https://", HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=0)
+            )
+            self._session = session
+        return self._session
+
+    def close(self):
+        """Close pooled HTTP connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def start_batching(self):
+        """Start the background flusher; must be called from a running loop"""
+        if not self.enabled or self._flusher_task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._flusher_task = asyncio.create_task(self._flusher())
+
+    async def stop_batching(self):
+        """Stop the flusher after it has sent whatever is still queued"""
+        if self._flusher_task is None:
+            return
+        task, self._flusher_task = self._flusher_task, None
+        self._queue.put_nowait(None)  # Sentinel: flush and exit
+        try:
+            await task
+        except asyncio.CancelledError:
+            # Shutdown cancelled the flusher as well; it posted the leftovers
+            if not task.cancelled():
+                raise
+        finally:
+            self._queue = None
+
+    def _split_batches(self, messages):
+        """Group messages into posts that respect the count and size limits"""
+        batch, size = [], 0
+        for message in messages:
+            if batch and (
+                len(batch) >= self.batch_max_messages
+                or size + len(message) > self.batch_max_chars
+            ):
+                yield batch
+                batch, size = [], 0
+            batch.append(message)
+            size += len(message) + len(self.batch_separator)
+        if batch:
+            yield batch
+
+    async def _flusher(self):
+        """Coalesce queued messages into a single post every batch interval"""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        pending = []  # Collected but not yet handed to a send
+        stopping = False
+        try:
+            while not stopping:
+                message = await queue.get()
+                if message is None:
+                    return
+                pending.append(message)
+                size = len(message)
+                deadline = loop.time() + self.batch_interval_seconds
+
+                # Keep collecting until the window closes or the post is full
+                while (
+                    len(pending) < self.batch_max_messages
+                    and size < self.batch_max_chars
+                ):
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        message = await asyncio.wait_for(queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    if message is None:
+                        stopping = True
+                        break
+                    pending.append(message)
+                    size += len(message) + len(self.batch_separator)
+
+                while pending:
+                    chunk = next(self._split_batches(pending))
+                    del pending[: len(chunk)]
+                    await self._send_batch(chunk)
+        except asyncio.CancelledError:
+            # Cancelled at shutdown (e.g. Ctrl-C): post what is left, then exit
+            while not queue.empty():
+                message = queue.get_nowait()
+                if message is not None:
+                    pending.append(message)
+            for chunk in self._split_batches(pending):
+                await self._send_batch(chunk)
+            raise
+
+    async def _send_batch(self, messages):
+        """Post batched messages together, one by one if Telegram rejects the post"""
+        status = await self._post_message(self.batch_separator.join(messages))
+        if status == 200:
+            return
+
+        # One malformed message makes Telegram reject (400) the whole post
+        dropped = len(messages)
+        if status == 400 and len(messages) > 1:
+            dropped = 0
+            for message in messages:
+                if not await self._send_telegram_message(message):
+                    dropped += 1
+        if dropped:
+            print(f"⚠️ Telegram batch: {dropped} of {len(messages)} messages dropped")
+
     async def test_connection(self) -> bool:
         """Test Telegram bot connection"""
         if not self.enabled:
@@ -63,7 +220,10 @@ class TelegramNotifier:
 
         try:
             url = f"https://api.telegram.org/bot{self.bot_token}/getMe"
-            response = requests.get(url, timeout=10)
+            # Blocking HTTP runs in a worker thread so the event loop stays free
+            response = await asyncio.to_thread(
+                self._get_session().get, url, timeout=10
+            )
 
             if response.status_code == 200:
                 bot_info = response.json()
@@ -80,20 +240,30 @@ class TelegramNotifier:
             return False
 
     def _should_send_notification(self, notification_type: NotificationType) -> bool:
-        """Check rate limiting"""
+        """Check rate limiting against the sliding window for this type"""
         if not self.enabled:
             return False
 
-        min_interval = self.min_interval_seconds.get(notification_type, 0)
-        if min_interval == 0:
+        window = self.min_interval_seconds.get(notification_type, 0)
+        if window == 0:
             return True
 
-        last_time = self.last_notification_time.get(notification_type)
-        if last_time is None:
+        sent_times = self._sent_times.get(notification_type)
+        if not sent_times:
             return True
 
-        time_since_last = (datetime.now() - last_time).total_seconds()
-        return time_since_last >= min_interval
+        # Monotonic clock so wall-clock adjustments can't skew the window
+        cutoff = time.monotonic() - window
+        while sent_times and sent_times[0] <= cutoff:
+            sent_times.popleft()
+        return len(sent_times) < self.max_per_window
+
+    def _record_notification(self, notification_type: NotificationType):
+        """Count a sent notification towards its rate-limit window"""
+        if self.min_interval_seconds.get(notification_type, 0):
+            self._sent_times.setdefault(notification_type, deque()).append(
+                time.monotonic()
+            )
 
     async def send_notification(
         self,
@@ -104,6 +274,8 @@ class TelegramNotifier:
         force: bool = False,
     ) -> bool:
         """Send notification to Telegram"""
+        if not self.enabled:  # Skip all formatting when notifications are off
+            return False
 
         if not force and not self._should_send_notification(notification_type):
             return False
@@ -114,21 +286,19 @@ class TelegramNotifier:
 
         try:
             # Format message
-            emoji = notification_type.value
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            emoji = _EMOJI[notification_type]
+            timestamp = _clock_time()
 
-            formatted_message = f"{emoji} *{title}*\n"
-            formatted_message += f"🕐 {timestamp}\n\n"
-            formatted_message += message
+            parts = [f"{emoji} *{title}*\n🕐 {timestamp}\n\n", message]
 
             # Add extra data
             if extra_data:
-                formatted_message += "\n\n📊 *Details:*\n"
-                for key, value in extra_data.items():
-                    formatted_message += f"• {key}: `{value}`\n"
+                parts.append("\n\n📊 *Details:*\n")
+                parts.extend(f"• {key}: `{value}`\n" for key, value in extra_data.items())
 
             # Add database note
-            formatted_message += "\n\n*🗄️ Logged to database*"
+            parts.append("\n\n*🗄️ Logged to database*")
+            formatted_message = "".join(parts)
 
             # Truncate if too long
             if len(formatted_message) > self.max_message_length:
@@ -137,11 +307,17 @@ class TelegramNotifier:
                     + "...\n\n*Message truncated*"
                 )
 
+            # Queue for the flusher when batching; forced messages go out now
+            if self._queue is not None and not force:
+                self._queue.put_nowait(formatted_message)
+                self._record_notification(notification_type)
+                return True
+
             # Send message
             success = await self._send_telegram_message(formatted_message)
 
             if success:
-                self.last_notification_time[notification_type] = datetime.now()
+                self._record_notification(notification_type)
 
             return success
 
@@ -153,7 +329,10 @@ class TelegramNotifier:
         """Send message to Telegram with retry logic"""
         if not self.enabled:
             return False
+        return await self._post_message(message) == 200
 
+    async def _post_message(self, message: str) -> Optional[int]:
+        """POST sendMessage with retries; returns the last HTTP status (None if unreachable)"""
         url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
 
         payload = {
@@ -163,12 +342,17 @@ class TelegramNotifier:
             "disable_web_page_preview": True,
         }
 
+        status = None
         for attempt in range(self.retry_attempts):
+            retry_after = None
             try:
-                response = requests.post(url, json=payload, timeout=10)
+                response = await asyncio.to_thread(
+                    self._get_session().post, url, json=payload, timeout=10
+                )
+                status = response.status_code
 
                 if response.status_code == 200:
-                    return True
+                    return status
                 else:
                     print(
                         f"⚠️ Telegram API error (attempt {attempt + 1}): {response.status_code}"
@@ -178,13 +362,35 @@ class TelegramNotifier:
                     if response.status_code in [400, 401, 403]:
                         break
 
+                    # Rate limited: Telegram says how long to wait
+                    if response.status_code == 429:
+                        retry_after = self._retry_after(response)
+
             except Exception as e:
                 print(f"⚠️ Telegram send error (attempt {attempt + 1}): {e}")
 
             if attempt < self.retry_attempts - 1:
-                await asyncio.sleep(self.retry_delay * (attempt + 1))
+                await asyncio.sleep(self._retry_delay(attempt, retry_after))
+
+        return status
 
-        return False
+    @staticmethod
+    def _retry_after(response) -> Optional[float]:
+        """Wait hint from a 429: Retry-After header, else parameters.retry_after"""
+        try:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is None:
+                retry_after = response.json()["parameters"]["retry_after"]
+            return float(retry_after)
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Retry-After when given (capped), else exponential backoff with full jitter"""
+        if retry_after is not None:
+            return min(self.retry_max_delay, max(0.0, retry_after))
+        cap = min(self.retry_max_delay, self.retry_delay * 2**attempt)
+        return random.uniform(0, cap)
 
     # Simplified notification methods
 
@@ -192,15 +398,21 @@ class TelegramNotifier:
         self, symbol: str, action: str, price: float, quantity: float, level: int = None
     ):
         """Notify trade attempt"""
+        if not self.enabled:
+            return
+
         title = f"{action} Order Placed"
-        message = f"💹 *{symbol}* {action}\n"
-        message += f"💵 Price: `${price:.4f}`\n"
-        message += f"📦 Quantity: `{quantity:.6f}`\n"
-        message += f"💰 Value: `${price * quantity:.2f}`"
+        lines = [
+            f"💹 *{symbol}* {action}",
+            f"💵 Price: `${price:.4f}`",
+            f"📦 Quantity: `{quantity:.6f}`",
+            f"💰 Value: `${price * quantity:.2f}`",
+        ]
 
         if level:
-            message += f"\n🎯 Grid Level: `{level}`"
+            lines.append(f"🎯 Grid Level: `{level}`")
 
+        message = "\n".join(lines)
         await self.send_notification(NotificationType.TRADE_ATTEMPT, title, message)
 
     async def notify_trade_success(
@@ -213,15 +425,22 @@ class TelegramNotifier:
         profit: float = None,
     ):
         """Notify successful trade"""
+        if not self.enabled:
+            return
+
         title = f"{action} Order Filled! 🎉"
-        message = f"💹 *{symbol}* {action} EXECUTED\n"
-        message += f"💵 Fill Price: `${price:.4f}`\n"
-        message += f"📦 Quantity: `{quantity:.6f}`\n"
-        message += f"💰 Total: `${price * quantity:.2f}`"
+        lines = [
+            f"💹 *{symbol}* {action} EXECUTED",
+            f"💵 Fill Price: `${price:.4f}`",
+            f"📦 Quantity: `{quantity:.6f}`",
+            f"💰 Total: `${price * quantity:.2f}`",
+        ]
 
         if profit is not None:
             profit_emoji = "📈" if profit > 0 else "📉"
-            message += f"\n{profit_emoji} P&L: `${profit:.2f}`"
+            lines.append(f"{profit_emoji} P&L: `${profit:.2f}`")
+
+        message = "\n".join(lines)
 
         extra_data = {}
         if order_id:
@@ -240,14 +459,17 @@ class TelegramNotifier:
         quantity: float = None,
     ):
         """Notify trade error"""
+        if not self.enabled:
+            return
+
         title = f"{action} Order Failed"
-        message = f"💹 *{symbol}* {action} FAILED\n"
-        message += f"🚨 Error: `{error_message}`"
+        lines = [f"💹 *{symbol}* {action} FAILED", f"🚨 Error: `{error_message}`"]
 
         if price and quantity:
-            message += f"\n💵 Attempted Price: `${price:.4f}`\n"
-            message += f"📦 Attempted Quantity: `{quantity:.6f}`"
+            lines.append(f"💵 Attempted Price: `${price:.4f}`")
+            lines.append(f"📦 Attempted Quantity: `{quantity:.6f}`")
 
+        message = "\n".join(lines)
         await self.send_notification(NotificationType.TRADE_ERROR, title, message)
 
     async def notify_portfolio_update(
@@ -257,48 +479,58 @@ class TelegramNotifier:
         top_assets: Dict[str, float] = None,
     ):
         """Notify portfolio update"""
+        if not self.enabled:
+            return
+
         title = "Portfolio Update"
-        message = f"💰 Total Value: `${total_value:.2f}`"
+        lines = [f"💰 Total Value: `${total_value:.2f}`"]
 
         if daily_change is not None:
             change_emoji = "📈" if daily_change >= 0 else "📉"
-            message += f"\n{change_emoji} 24h Change: `${daily_change:+.2f}` ({daily_change / total_value * 100:+.1f}%)"
+            lines.append(
+                f"{change_emoji} 24h Change: `${daily_change:+.2f}` ({daily_change / total_value * 100:+.1f}%)"
+            )
 
         if top_assets:
-            message += "\n\n🏆 *Top Holdings:*"
+            lines.append("\n🏆 *Top Holdings:*")
             for asset, value in list(top_assets.items())[:5]:
                 percentage = (value / total_value) * 100
-                message += f"\n• {asset}: `${value:.2f}` ({percentage:.1f}%)"
+                lines.append(f"• {asset}: `${value:.2f}` ({percentage:.1f}%)")
 
+        message = "\n".join(lines)
         await self.send_notification(NotificationType.PORTFOLIO_UPDATE, title, message)
 
     async def notify_grid_reset(
         self, symbol: str, old_price: float, new_price: float, reason: str
     ):
         """Notify grid reset"""
+        if not self.enabled:
+            return
+
         title = f"Grid Reset: {symbol}"
         change_percent = ((new_price - old_price) / old_price) * 100
         change_emoji = "📈" if change_percent >= 0 else "📉"
 
-        message = f"🔄 *{symbol}* Grid Reconfigured\n"
-        message += f"📊 Old Center: `${old_price:.4f}`\n"
-        message += f"📊 New Center: `${new_price:.4f}`\n"
-        message += f"{change_emoji} Change: `{change_percent:+.1f}%`\n"
-        message += f"💡 Reason: {reason}"
+        message = "\n".join(
+            [
+                f"🔄 *{symbol}* Grid Reconfigured",
+                f"📊 Old Center: `${old_price:.4f}`",
+                f"📊 New Center: `${new_price:.4f}`",
+                f"{change_emoji} Change: `{change_percent:+.1f}%`",
+                f"💡 Reason: {reason}",
+            ]
+        )
 
         await self.send_notification(NotificationType.GRID_RESET, title, message)
 
     async def notify_bot_status(self, status: str, details: str = None):
         """Notify bot status changes"""
-        if status.lower() in ["start", "started", "startup"]:
-            notification_type = NotificationType.BOT_START
-            title = "🚀 Trading Bot Started"
-        elif status.lower() in ["stop", "stopped", "shutdown"]:
-            notification_type = NotificationType.BOT_STOP
-            title = "🛑 Trading Bot Stopped"
-        elif status.lower() in ["error", "crash", "exception"]:
-            notification_type = NotificationType.BOT_ERROR
-            title = "💥 Trading Bot Error"
+        if not self.enabled:
+            return
+
+        notification_type = _BOT_STATUS_TYPES.get(status.lower())
+        if notification_type is not None:
+            title = _BOT_STATUS_TITLES[notification_type]
         else:
             notification_type = NotificationType.INFO
             title = f"Bot Status: {status}"